@@ -1,19 +1,33 @@
+import numpy as np
 import pandas as pd
 from word2number import w2n
-from openpyxl import Workbook
-from openpyxl.styles import NamedStyle
-def cargar_datos(ruta_archivo):
+from openpyxl.utils import get_column_letter
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:  # pyarrow es opcional
+    pa = None
+def cargar_datos(ruta_archivo, **kwargs):
     """
     Carga los datos desde un archivo CSV.
+        -Usa el lector de pyarrow si está disponible; si no, el motor C de pandas.
+        -Lee FechaCierre como texto; limpiar_datos la convierte con el formato estricto.
     Parametros: 
         -ruta_archivo (str): Rusta completa dl archivo CSV.
+        -kwargs: Opciones adicionales para pd.read_csv.
     Retorna:
         -pd.DataFrame: Datos cargados en un DataFrame de pandas.
     """
-    return pd.read_csv(ruta_archivo, encoding='utf-8')
+    opciones = {
+        'encoding': 'utf-8',
+        'dtype': {'FechaCierre': str},
+    }
+    opciones.update(kwargs)
+    motor = opciones.pop('engine', 'c' if pa is None else 'pyarrow')
+    return pd.read_csv(ruta_archivo, engine=motor, **opciones)
 
 # Función: Limpiar datos
-def limpiar_datos(tabla):
+def limpiar_datos(tabla, verbose=False):
     """
     Realiza la limpiezada inicial de los datos.
         -Convierte los valores escritos como palabras a números.
@@ -21,10 +35,11 @@ def limpiar_datos(tabla):
         -Reemplaza todos los valores nulos en la columna Importe a 0.
         -Corrige el formato de la columna FechaCierre
         -Unifica la columna Zona para que no haya espacios de sobra. 
-        -Reemplaza los valores nulos y "sin datos" por 0's en la columna de Participantes
-        -Elimina los registros duplicados.
+        -Reemplaza los valores nulos (incluye "Sin datos") por 0's en la columna de Participantes
+        -Elimina los registros duplicados por IdOportunidad.
     Parametros: 
         -tabla(pd.DataFrame): DataFrame original sin limpiar
+        -verbose (bool): Si es True, imprime la información y los nulos de la tabla.
     Retorna:
         -tabla(pd.DataFrame): DataFrame limpio y transformado
     """
@@ -32,66 +47,76 @@ def limpiar_datos(tabla):
     # Identificar campos escritos como palabras y convertirlos a números
     def convertir_a_numero(valor):
         try:
-            if isinstance(valor, str):  
-                return w2n.word_to_num(valor.lower())  
+            return w2n.word_to_num(valor)
         except ValueError:
-            pass  # Si falla, devolver el valor original
-        return valor
-
-    tabla['Importe'] = tabla['Importe'].apply(convertir_a_numero)
-    tabla['Importe'] = pd.to_numeric(tabla['Importe'], errors='coerce')
-    tabla['Importe'] = tabla['Importe'].fillna(0)
+            return np.nan  # Si falla, se deja como nulo
+
+    # Solo los valores que no son numéricos pasan por word2number, una vez por palabra distinta
+    importe = pd.to_numeric(tabla['Importe'], errors='coerce')
+    mascara = importe.isna() & tabla['Importe'].notna()
+    palabras = tabla.loc[mascara, 'Importe'].astype(str).str.lower()
+    cache = {palabra: convertir_a_numero(palabra) for palabra in palabras.unique()}
+    importe.loc[mascara] = palabras.map(cache)
+    tabla['Importe'] = importe.fillna(0)
     
     tabla['FechaCierre'] = pd.to_datetime(tabla['FechaCierre'], format='%d/%m/%Y %H:%M', errors='coerce')
-    tabla['FechaCierre'] = tabla['FechaCierre'].dt.date
     
-    tabla['Zona'] = tabla['Zona'].fillna('Zona 6')
-    tabla['Zona'] = tabla['Zona'].str.strip()
-    tabla['Zona'] = tabla['Zona'].astype('category')
+    # Se limpian las categorías (pocas zonas distintas) en lugar de cada registro
+    tabla['Zona'] = tabla['Zona'].fillna('Zona 6').astype('category')
+    tabla['Zona'] = tabla['Zona'].map(str.strip).astype('category')
     
-    tabla['Participantes'] = tabla['Participantes'].replace('Sin datos', 0)
-    tabla['Participantes'] = pd.to_numeric(tabla['Participantes'], errors='coerce')
-    tabla['Participantes'] = tabla['Participantes'].fillna(0)
+    # "Sin datos" y otros textos no numéricos se vuelven nulos y después 0
+    tabla['Participantes'] = pd.to_numeric(tabla['Participantes'], errors='coerce').fillna(0)
+    tabla['Participantes'] = pd.to_numeric(tabla['Participantes'], downcast='unsigned')  # Tipo entero más pequeño que conserve los valores
 
     # Eliminar duplicados en 'IdOportunidad'
     #print("Número de filas duplicadas (antes):", tabla.duplicated().sum())
-    #tabla = tabla.drop_duplicates(subset=['IdOportunidad'])
-    tabla = tabla.drop_duplicates()  # Sin 'subset', considera toda la fila
+    tabla = tabla.drop_duplicates(subset=['IdOportunidad'], keep='first')  # IdOportunidad identifica cada registro
     #print("Número de filas duplicadas (después):", tabla.duplicated().sum())
 
-    print("Información general de la tabla:")
-    print(tabla.info())
-    print("\nConteo de valores nulos por columna después de la limpieza:")
-    print(tabla.isnull().sum())
+    if verbose:
+        print("Información general de la tabla:")
+        print(tabla.info())
+        print("\nConteo de valores nulos por columna después de la limpieza:")
+        print(tabla.isnull().sum())
     return tabla
 
 # Función: Normalizar datos
-def normalizar_datos(tabla, tasas_cambio):
+def normalizar_datos(tabla, tasas_cambio, verbose=False):
     """
     Normaliza los datos monetarios las fechas
-        -Estandariza el formato de la fecha a tipo date.
+        -Normaliza la hora de la fecha de cierre, conservando el tipo datetime.
         -Convierte el importe a distintas divisas.
     Parametros: 
         -tabla(pd.DataFrame): DataFrame limpio y transformado
         -tasas_cambio (dict): Diccionario con tasas de cambio por divisa.
+        -verbose (bool): Si es True, imprime la información de la tabla.
     Retorna:
         -tabla(pd.DataFrame): DataFrame con importes normalizados y fechas formateadas.
     """
-    # Convertir FechaCierre a datetime y normalizar la hora
-    tabla['FechaCierre'] = pd.to_datetime(tabla['FechaCierre'], format='%d/%m/%Y %H:%M', errors='coerce').dt.normalize()
+    # Normalizar la hora de FechaCierre (ya es datetime desde la limpieza)
+    tabla['FechaCierre'] = tabla['FechaCierre'].dt.normalize()
 
-    tabla['TipoDivisaAjuste'] = tabla['TipoDivisaAjuste'].str.upper()
+    tabla['TipoDivisaAjuste'] = tabla['TipoDivisaAjuste'].astype('category').map(str.upper, na_action='ignore').astype('category')
     # Crear columnas de conversión con tasas específicas
-    tabla['Importe_MXN'] = tabla.apply(lambda row: row['Importe'] * tasas_cambio[row['TipoDivisaAjuste']], axis=1)
-    tabla['Importe_USD'] = tabla.apply(lambda row: row['Importe_MXN'] / 20, axis=1)  # Tasa de cambio para USD
-    tabla['Importe_EUR'] = tabla.apply(lambda row: row['Importe_MXN'] / 22, axis=1)  # Tasa de cambio para EUR
-
-    print("Información general de la tabla:")
-    print(tabla.info())
+    tasas = tabla['TipoDivisaAjuste'].map(tasas_cambio).to_numpy(dtype='float64')
+    # Divisas nulas o sin tasa de cambio detienen el proceso en lugar de dejar importes nulos
+    sin_tasa = np.isnan(tasas)
+    if sin_tasa.any():
+        divisas = tabla.loc[sin_tasa, 'TipoDivisaAjuste'].unique().tolist()
+        raise KeyError(f"Divisas sin tasa de cambio: {divisas}")
+    importe_mxn = tabla['Importe'].to_numpy(dtype='float64') * tasas
+    tabla['Importe_MXN'] = importe_mxn
+    tabla['Importe_USD'] = importe_mxn * (1 / 20.0)  # Tasa de cambio para USD
+    tabla['Importe_EUR'] = importe_mxn * (1 / 22.0)  # Tasa de cambio para EUR
+
+    if verbose:
+        print("Información general de la tabla:")
+        print(tabla.info())
     return tabla
 
 # Función: Generar columnas derivadas
-def generar_columnas(tabla):
+def generar_columnas(tabla, verbose=False):
     """
     Genera columnas derivadas y clasificaciones.
         -Se crean identificadores unicos legibles.
@@ -100,13 +125,20 @@ def generar_columnas(tabla):
         -Segmenta fechas en mes, año y trimestre.
     Parametros: 
         -tabla (pd.DataFrame): DataFrame normalizado.
+        -verbose (bool): Si es True, imprime la información de la tabla.
     Retorna:
         -tabla (pd.DataFrame): DataFrame enriquecido con columnas adicionales.
     """
+    # Numerar los identificadores en orden de aparición y formatear solo un folio por valor único
+    def generar_folio(columna, prefijo):
+        codigos, unicos = pd.factorize(columna, use_na_sentinel=False)
+        folios = np.char.add(prefijo + ' ', np.arange(1, len(unicos) + 1).astype('U'))
+        return pd.Categorical.from_codes(codigos, categories=folios)
+
     # Generar folios
-    tabla['FolioOportunidad'] = tabla['IdOportunidad'].map({id_op: f"Oportunidad {i+1}" for i, id_op in enumerate(tabla['IdOportunidad'].unique())})
-    tabla['FolioEmpresa'] = tabla['IdEmpresa'].map({id_emp: f"Empresa {i+1}" for i, id_emp in enumerate(tabla['IdEmpresa'].unique())})
-    tabla['FolioPropietario'] = tabla['IdPropietario'].map({id_prop: f"Propietario {i+1}" for i, id_prop in enumerate(tabla['IdPropietario'].unique())})
+    tabla['FolioOportunidad'] = generar_folio(tabla['IdOportunidad'], 'Oportunidad')
+    tabla['FolioEmpresa'] = generar_folio(tabla['IdEmpresa'], 'Empresa')
+    tabla['FolioPropietario'] = generar_folio(tabla['IdPropietario'], 'Propietario')
     
     # Clasificación por rango de importe
     rangos = [0, 217000, 537000, 34000000]
@@ -116,14 +148,20 @@ def generar_columnas(tabla):
     # Clasificación de zonas importantes
     ingresos_por_zona = tabla.groupby('Zona', observed=True)['Importe_MXN'].sum().sort_values(ascending=False)
     zonas_importantes = ingresos_por_zona.head(3).index.tolist()
-    tabla['ClasificacionZona'] = tabla['Zona'].apply(lambda x: 'Importante' if x in zonas_importantes else 'Otras')
+    tabla['ClasificacionZona'] = pd.Categorical.from_codes(
+        tabla['Zona'].isin(zonas_importantes).astype('int8'),
+        categories=['Otras', 'Importante']
+    )
     
     # Segmentar fechas
-    tabla['AnoCierre'] = pd.to_datetime(tabla['FechaCierre']).dt.year
-    tabla['MesCierre'] = pd.to_datetime(tabla['FechaCierre']).dt.month
-    tabla['TrimestreCierre'] = pd.to_datetime(tabla['FechaCierre']).dt.quarter
+    fecha_cierre = tabla['FechaCierre'].dt
+    # Tipos enteros con nulos: las fechas no válidas (NaT) quedan como nulos
+    tabla['AnoCierre'] = fecha_cierre.year.astype('Int16')
+    tabla['MesCierre'] = fecha_cierre.month.astype('Int8')
+    tabla['TrimestreCierre'] = fecha_cierre.quarter.astype('Int8')
     
-    print(tabla.info())
+    if verbose:
+        print(tabla.info())
     return tabla
 
 # Función: Calcular agrupaciones
@@ -142,51 +180,32 @@ def calcular_agrupaciones(tabla):
             - ingresos_propietarios
     """
     
+    # Suma y conteo de importes en un solo recorrido por grupo
+    def calcular_densidad(columna):
+        densidad = tabla.groupby(columna, observed=True)['Importe_MXN'].agg(['sum', 'size'])
+        densidad.columns = ['IngresoTotal', 'Oportunidades']
+        densidad['DensidadIngreso'] = densidad['IngresoTotal'] / densidad['Oportunidades']
+        return densidad.reset_index()
+
     # Densidad de ingresos por zona
-    densidad_ingresos_zona = tabla.groupby('Zona', observed=True).agg(
-        IngresoTotal=('Importe_MXN', 'sum'),
-        Oportunidades=('IdOportunidad', 'count')
-    ).reset_index()
-    densidad_ingresos_zona['DensidadIngreso'] = densidad_ingresos_zona['IngresoTotal'] / densidad_ingresos_zona['Oportunidades']
+    densidad_ingresos_zona = calcular_densidad('Zona')
     
     # Densidad de ingresos por empresa
-    densidad_ingresos_empresa = tabla.groupby('FolioEmpresa').agg(
-        IngresoTotal=('Importe_MXN', 'sum'),
-        Oportunidades=('IdOportunidad', 'count')
-    ).reset_index()
-    densidad_ingresos_empresa['DensidadIngreso'] = densidad_ingresos_empresa['IngresoTotal'] / densidad_ingresos_empresa['Oportunidades']
+    densidad_ingresos_empresa = calcular_densidad('FolioEmpresa')
     
-    # Clasificación de propietarios
-    ingresos_propietarios = tabla.groupby('FolioPropietario').agg(
-        IngresoTotal=('Importe_MXN', 'sum')
-    ).reset_index()
-    ingresos_propietarios['Clasificacion'] = pd.qcut(
-        ingresos_propietarios['IngresoTotal'], 
-        q=3, 
-        labels=['Bajo', 'Medio', 'Top']
+    # Clasificación de propietarios en terciles de ingreso
+    ingresos_propietarios = tabla.groupby('FolioPropietario', observed=True)['Importe_MXN'].sum().rename('IngresoTotal').reset_index()
+    ingreso_total = ingresos_propietarios['IngresoTotal'].to_numpy()
+    terciles = np.quantile(ingreso_total, [1 / 3, 2 / 3])
+    ingresos_propietarios['Clasificacion'] = pd.Categorical.from_codes(
+        np.searchsorted(terciles, ingreso_total),
+        categories=['Bajo', 'Medio', 'Top'],
+        ordered=True
     )
     
     return densidad_ingresos_zona, densidad_ingresos_empresa,ingresos_propietarios
 
 
-# Función: Reordenar columnas
-def reordenar_columnas(tabla):
-    """
-    Descripción: 
-    Parametros: 
-    Retorna:
-    """
-    """Reordena las columnas del DataFrame."""
-    columnas_ordenadas = [
-        'IdOportunidad', 'FolioOportunidad',
-        'IdEmpresa', 'FolioEmpresa',
-        'IdPropietario', 'FolioPropietario',
-        'Zona', 'ClasificacionZona', 'TipoDivisaAjuste',
-        'Importe', 'Importe_MXN', 'Importe_USD', 'Importe_EUR', 'RangoImporte',
-        'FechaCierre', 'AnoCierre', 'MesCierre', 'TrimestreCierre', 'Participantes'
-    ]
-    return tabla[columnas_ordenadas]
-
 def calcular_crecimientos(tabla):
     """
     Calcula el crecimiento porcentual anual por empresa, propietario y zona.
@@ -200,17 +219,37 @@ def calcular_crecimientos(tabla):
             - crecimiento_zonas
     """
 
+    # Sumar importes por año una sola vez para todas las combinaciones de empresa, propietario y zona
+    # dropna=False conserva los registros con alguna llave nula para las tablas que no usan esa llave
+    importes_por_ano = tabla.groupby(
+        ['IdEmpresa', 'FolioEmpresa', 'IdPropietario', 'FolioPropietario', 'Zona', 'AnoCierre'],
+        observed=True,
+        dropna=False
+    )['Importe_MXN'].sum()
+    # Los registros sin año de cierre no participan en la comparación
+    importes_por_ano = importes_por_ano[importes_por_ano.index.get_level_values('AnoCierre').notna()].unstack(fill_value=0)
+
+    # Reagrupar por los niveles indicados y comparar 2024 contra 2023
+    def calcular_crecimiento(niveles):
+        crecimiento = importes_por_ano.groupby(level=niveles, observed=True).sum()
+        anterior = crecimiento[2023].to_numpy(dtype='float64')
+        actual = crecimiento[2024].to_numpy(dtype='float64')
+        # Operaciones en el mismo arreglo para no crear temporales intermedios
+        porcentaje = actual - anterior
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(porcentaje, anterior, out=porcentaje)
+        np.multiply(porcentaje, 100, out=porcentaje)
+        crecimiento['Crecimiento_%'] = porcentaje
+        return crecimiento
+
     # Calcular crecimiento anual de empresas
-    crecimiento_empresas = tabla.groupby(['IdEmpresa', 'FolioEmpresa', 'AnoCierre'])['Importe_MXN'].sum().unstack(fill_value=0)
-    crecimiento_empresas['Crecimiento_%'] = ((crecimiento_empresas[2024] - crecimiento_empresas[2023]) / crecimiento_empresas[2023]) * 100
+    crecimiento_empresas = calcular_crecimiento(['IdEmpresa', 'FolioEmpresa'])
 
     # Calcular crecimiento anual de propietarios
-    crecimiento_propietarios = tabla.groupby(['IdPropietario', 'FolioPropietario', 'AnoCierre'])['Importe_MXN'].sum().unstack(fill_value=0)
-    crecimiento_propietarios['Crecimiento_%'] = ((crecimiento_propietarios[2024] - crecimiento_propietarios[2023]) / crecimiento_propietarios[2023]) * 100
+    crecimiento_propietarios = calcular_crecimiento(['IdPropietario', 'FolioPropietario'])
 
     # Calcular crecimiento anual por zonas
-    crecimiento_zonas = tabla.groupby(['Zona', 'AnoCierre'], observed=False)['Importe_MXN'].sum().unstack(fill_value=0)
-    crecimiento_zonas['Crecimiento_%'] = ((crecimiento_zonas[2024] - crecimiento_zonas[2023]) / crecimiento_zonas[2023]) * 100
+    crecimiento_zonas = calcular_crecimiento(['Zona'])
     return crecimiento_empresas, crecimiento_propietarios, crecimiento_zonas
 
 # Función: Reordenar columnas
@@ -230,78 +269,80 @@ def reordenar_columnas(tabla):
         'Importe', 'Importe_MXN', 'Importe_USD', 'Importe_EUR', 'RangoImporte',
         'FechaCierre', 'AnoCierre', 'MesCierre', 'TrimestreCierre', 'Participantes'
     ]
-    return tabla[columnas_ordenadas]
+    # Con Copy-on-Write (pandas 3) el reordenamiento comparte los datos en lugar de copiarlos
+    return tabla.reindex(columns=columnas_ordenadas)
 
 
-def exportar_datos_con_formato(tabla, ruta_salida):
+def exportar_excel(tabla, crecimientos, ruta_salida):
     """
-    Exporta los datos a un archivo Excel.
+    Exporta los datos y las hojas de crecimiento a un archivo Excel en una sola escritura.
     Parametros: 
         -tabla (pd.DataFrame): DataFrame enriquecido.
+        -crecimientos (tuple): Tres DataFrames con el crecimiento calculado:
+            - crecimiento_empresas
+            - crecimiento_propietarios
+            - crecimiento_zonas
         -ruta_salida (str): Ruta del archivo Excel donde se guardarán los datos.
     Retorna:
     """
-    # Crear estilos para columnas
-    date_style = NamedStyle(name="date", number_format="YYYY-MM-DD")
-    float_style = NamedStyle(name="float", number_format="#,##0.00")
-    int_style = NamedStyle(name="int", number_format="0")
+    crecimiento_empresas, crecimiento_propietarios, crecimiento_zonas = crecimientos
+
+    # Formatos numéricos por tipo de columna
+    formato_fecha = "YYYY-MM-DD"
+    formato_float = "#,##0.00"
+    formato_int = "0"
 
     # Crear archivo Excel
     with pd.ExcelWriter(ruta_salida, engine='openpyxl') as writer:
         tabla.to_excel(writer, index=False, sheet_name="Datos")
-        workbook = writer.book
         worksheet = writer.sheets["Datos"]
 
-        # Aplicar estilos de columnas basados en tipos de datos
+        # Aplicar formatos por columna basados en tipos de datos
         for col_idx, column in enumerate(tabla.columns, start=1):
             col_type = tabla[column].dtype
             if pd.api.types.is_datetime64_any_dtype(col_type):
-                for row in range(2, len(tabla) + 2):  # Ajustar a las celdas de datos
-                    worksheet.cell(row=row, column=col_idx).style = date_style
+                formato = formato_fecha
             elif pd.api.types.is_numeric_dtype(col_type):
-                style = float_style if pd.api.types.is_float_dtype(col_type) else int_style
-                for row in range(2, len(tabla) + 2):
-                    worksheet.cell(row=row, column=col_idx).style = style
+                formato = formato_float if pd.api.types.is_float_dtype(col_type) else formato_int
+            else:
+                continue
+            for celda in worksheet[get_column_letter(col_idx)][1:]:  # Omitir el encabezado
+                celda.number_format = formato
 
-    print("Datos exportados con formatos explícitos para Excel.")
-
-
-def agregar_hojas_crecimiento(tabla, ruta_salida,crecimiento_empresas, crecimiento_propietarios, crecimiento_zonas):
-    """
-    Agrega hojas para crecimientos al excel.
-    Parametros: 
-        -tabla (pd.DataFrame): DataFrame enriquecido.
-        -ruta_salida (str): Rusta completa dl archivo CSV.
-        Tres DataFrames con el crecimiento calculado:
-            - crecimiento_empresas
-            - crecimiento_propietarios
-            - crecimiento_zonas
-    Retorna:
-    """
-    # Agregar nuevas hojas al archivo Excel
-    with pd.ExcelWriter(ruta_salida, engine='openpyxl', mode='a') as writer:
+        # Agregar hojas de crecimiento
         crecimiento_empresas.to_excel(writer, sheet_name='Crecimiento_Empresas')
         crecimiento_propietarios.to_excel(writer, sheet_name='Crecimiento_Propietarios')
         crecimiento_zonas.to_excel(writer, sheet_name='Crecimiento_Zonas')
 
+    print("Datos exportados con formatos explícitos para Excel.")
+
 def exportar_datos_csv(tabla, ruta_salida):
     """
     Exporta los datos a un archivo CSV para evitar pérdida de formatos.
+        -Usa el escritor CSV de pyarrow si está disponible; si no, DataFrame.to_csv.
+        -Con pyarrow los textos van entre comillas y los decimales enteros sin ".0" (ver README).
     Parametros: 
         -tabla (pd.DataFrame): DataFrame enriquecido.
         -ruta_salida (str): Ruta del archivo CSV donde se guardarán los datos.
     Retorna:
     """
-    tabla.to_csv(ruta_salida, index=False, encoding='utf-8')
+    if pa is None:
+        tabla.to_csv(ruta_salida, index=False, encoding='utf-8')
+    else:
+        tabla_arrow = pa.Table.from_pandas(tabla, preserve_index=False)
+        # FechaCierre ya está normalizada, se escribe solo la fecha como lo hace pandas
+        if 'FechaCierre' in tabla_arrow.column_names:
+            indice = tabla_arrow.schema.get_field_index('FechaCierre')
+            tabla_arrow = tabla_arrow.set_column(indice, 'FechaCierre', tabla_arrow.column(indice).cast(pa.date32()))
+        pv.write_csv(tabla_arrow, ruta_salida, write_options=pv.WriteOptions(include_header=True))
     print("Datos exportados exitosamente en formato CSV.")
 
 # Bloque principal del script: organiza la ejecución del flujo ETL
 # 1. Carga los datos desde un archivo CSV.
 # 2. Limpia y transforma los datos.
 # 3. Calcula métricas clave como densidades y crecimientos.
-# 4. Exporta los resultados a un archivo Excel.
-# 5. Genera hojas de crecimiento dentro del excel.
-# 6. Exporta los resultados a un archivo csv.
+# 4. Exporta los resultados y las hojas de crecimiento a un archivo Excel.
+# 5. Exporta los resultados a un archivo csv.
 if __name__ == "__main__":
 
     print("-----------------INICIANDO PROCESOS-----------")
@@ -360,13 +401,13 @@ if __name__ == "__main__":
     print("Reorganización de columnas .....")
     tabla = reordenar_columnas(tabla)
     
-    # Paso 7: Exportar datos procesados a un archivo Excel
+    # Paso 7: Calcular los crecimientos anuales
+    print("Calculando crecimientos .....")
+    crecimientos = calcular_crecimientos(tabla)
+
+    # Paso 8: Exportar datos procesados y hojas de crecimiento a un archivo Excel
     print("Exportando datos al Excel _NUEVA_BD_OPORTUNIDADES_23_24.xlsx .....")
-    exportar_datos_con_formato(tabla, ruta_salida)
-    # Paso 8: Calcular y agregar hojas de crecimiento al archivo Excel
-    print("Agregando hojas de cremientos al Excel _NUEVA_BD_OPORTUNIDADES_23_24.xlsx .....")
-    crecimiento_empresas, crecimiento_propietarios, crecimiento_zonas = calcular_crecimientos(tabla)
-    agregar_hojas_crecimiento(tabla, ruta_salida,crecimiento_empresas, crecimiento_propietarios, crecimiento_zonas)
+    exportar_excel(tabla, crecimientos, ruta_salida)
 
     #Exportar datos a un cvs para evitar la perdida de formatos
     exportar_datos_csv(tabla, ruta_salida_csv)